@@ -27,45 +27,14 @@ import logging
 import re
 from typing import List
 
-from cromulence.wordle import Dictionary, GameResponse, Guess
+from cromulence.wordle import Dictionary, Guess
+from cromulence.wordle.cache import cached_word_list
 from cromulence.wordle.dictionary import download_from_uri
 
 logging.basicConfig(level=logging.INFO)
 
-
-def gyb_to_game_response_enum(gyb_value: str) -> GameResponse:
-    """Convert a "G", "Y", or "B" response to the equivalent GameResponse value.
-
-    Conversion Table
-    ================
-
-    +----------------+------------------------+
-    | User Character | GameResponse Value     |
-    +================+========================+
-    |       G        | GameResponse.CORRECT   |
-    +----------------+------------------------+
-    |       Y        | GameResponse.ELSEWHERE |
-    +----------------+------------------------+
-    |       B        | GameResponse.INCORRECT |
-    +----------------+------------------------+
-
-    Args:
-        gyb_value: the user entered 'G'reen, 'Y'ellow, or 'B'lack value.
-
-    Returns:
-        A GameResponse enum value.
-
-    Raises:
-        ValueError: gyb_value is not one of "G", "Y", or "B".
-    """
-    if gyb_value == "G":
-        return GameResponse.CORRECT
-    if gyb_value == "Y":
-        return GameResponse.ELSEWHERE
-    if gyb_value == "B":
-        return GameResponse.INCORRECT
-
-    raise ValueError(f"{gyb_value} is not a supported GYB value.")
+# Matches the word list string in the main Quordle game script.
+_WORD_BANK_REGEX = re.compile(rb'(?<=wordBank:")[^"]+(?=")')
 
 
 def convert_to_guess(word: str, gyb: str) -> Guess:
@@ -79,13 +48,11 @@ def convert_to_guess(word: str, gyb: str) -> Guess:
 
     Returns:
         A Guess object.
-    """
-    if len(word) != len(gyb):
-        raise ValueError("Word and GYB values must be the same size")
 
-    return Guess(
-        [(word[i], gyb_to_game_response_enum(gyb[i])) for i in range(len(word))]
-    )
+    Raises:
+        ValueError: word and gyb are not the same size, or gyb is invalid.
+    """
+    return Guess.from_gyb(word, gyb)
 
 
 def download_quordle_dictionary() -> List[str]:
@@ -117,20 +84,17 @@ def download_quordle_dictionary() -> List[str]:
         return []
 
     script_uri = f"{uri_prefix}/{script_name_match_data[0]}"
-    js = download_from_uri(script_uri)
+    word_bank = download_from_uri(script_uri, pattern=_WORD_BANK_REGEX)
 
-    if not js:
+    if word_bank is None:
         logging.error(f"Failed to get source for script '{script_uri}'")
         return []
 
-    logging.debug("Searching for word list...")
-    match_data = re.search(r"(?<=wordBank:\")[^\"]+(?=\")", js)
-
-    if not match_data:
+    if not word_bank:
         logging.error("Failed to find word list.")
         return []
 
-    return match_data[0].split()
+    return word_bank.split()
 
 
 @click.command()
@@ -138,13 +102,10 @@ def main():
     click.echo("Downloading Quordle dictionary...")
 
     try:
-        word_list = download_quordle_dictionary()
-        dicts = [
-            Dictionary(word_list),
-            Dictionary(word_list),
-            Dictionary(word_list),
-            Dictionary(word_list),
-        ]
+        word_list = cached_word_list("quordle", download_quordle_dictionary)
+        # Dictionaries are never modified (pruning creates a new dictionary),
+        # so all four quadrants can share the same initial dictionary.
+        dicts = [Dictionary(word_list)] * 4
         num_dicts = len(dicts)
     except RuntimeError:
         click.echo("Failed to get Wordle dictionary!")
@@ -167,55 +128,45 @@ def main():
     click.echo("Example:")
     click.echo(">>> GBBYB BBYBB BBBBB GGYGB")
     click.echo("")
-    click.echo("If a quadrant is solved, enter BBBBBB.")
+    click.echo(f"If a quadrant is solved, enter {'B' * word_size}.")
+
+    # One response per dictionary, each a run of GYB characters the size of the
+    # guess word, separated by whitespace.
+    response_regex = re.compile(
+        r"\s+".join([f"([gybGYB]{{{word_size}}})"] * num_dicts)
+    )
 
     while True:
         user_input = click.prompt(
             "Enter the Game's Response (GYB)", default="", type=str
         )
 
-        gyb_input_list = user_input.split()
-        total_input_length = sum([len(gyb_value) for gyb_value in gyb_input_list])
-
-        if len(gyb_input_list) != 4:
-            click.echo(
-                f"ERROR: Expected 4 responses from Quordle game, received "
-                f"{len(gyb_input_list)}."
-            )
-        elif total_input_length != (word_size * num_dicts):
+        match_data = response_regex.fullmatch(user_input.strip())
+        if not match_data:
             click.echo(
-                f"ERROR: inputs must be same size as guess word "
-                f"({word_size} letters)"
+                f"ERROR: Expected {num_dicts} responses from Quordle game, each "
+                f"containing {word_size} 'G', 'Y', or 'B' characters."
             )
-        else:
-            valid_inputs = True
-            for gyb_values in gyb_input_list:
-                if not re.fullmatch("[gybGYB]+", gyb_values):
-                    click.echo("ERROR: input must only contain 'G', 'Y', or 'B'")
-                    valid_inputs = False
-                    break
-
-            if not valid_inputs:
-                continue
-
-            for i, gyb_values in enumerate(gyb_input_list):
-                guess = convert_to_guess(current_guess, gyb_values.upper())
-                click.echo(f"Filtering dictionary {i+1}...")
-                dicts[i] = dicts[i].prune(guess)
-                click.echo(f"Filtered dictionary size: {len(dicts[i])} entries")
-
-            # Choose next word based on whichever dictionary is currently
-            # smallest (should be fastest route to next answer).
-            min_words = 999999
-            best_dict = None
-            for i, d in enumerate(dicts):
-                dict_size = len(d)
-                if (dict_size > 0) and (dict_size < min_words):
-                    best_dict = d
-                    min_words = dict_size
-
-            current_guess = best_dict.get_most_likely_word()
-            click.echo(f"Try '{current_guess}'.")
+            continue
+
+        for i, gyb_values in enumerate(match_data.groups()):
+            guess = convert_to_guess(current_guess, gyb_values.upper())
+            click.echo(f"Filtering dictionary {i+1}...")
+            dicts[i] = dicts[i].prune(guess)
+            click.echo(f"Filtered dictionary size: {len(dicts[i])} entries")
+
+        # Choose next word based on whichever dictionary is currently
+        # smallest (should be fastest route to next answer).
+        min_words = 999999
+        best_dict = None
+        for i, d in enumerate(dicts):
+            dict_size = len(d)
+            if (dict_size > 0) and (dict_size < min_words):
+                best_dict = d
+                min_words = dict_size
+
+        current_guess = best_dict.get_most_likely_word()
+        click.echo(f"Try '{current_guess}'.")
 
 
 if __name__ == "__main__":
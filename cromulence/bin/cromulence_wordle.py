@@ -26,46 +26,11 @@ import re
 import click
 import logging
 
-from cromulence.wordle import Dictionary, GameResponse, Guess
+from cromulence.wordle import Dictionary, Guess
 
 logging.basicConfig(level=logging.INFO)
 
 
-def gyb_to_game_response_enum(gyb_value: str) -> GameResponse:
-    """Convert a "G", "Y", or "B" response to the equivalent GameResponse value.
-
-    Conversion Table
-    ================
-
-    +----------------+------------------------+
-    | User Character | GameResponse Value     |
-    +================+========================+
-    |       G        | GameResponse.CORRECT   |
-    +----------------+------------------------+
-    |       Y        | GameResponse.ELSEWHERE |
-    +----------------+------------------------+
-    |       B        | GameResponse.INCORRECT |
-    +----------------+------------------------+
-
-    Args:
-        gyb_value: the user entered 'G'reen, 'Y'ellow, or 'B'lack value.
-
-    Returns:
-        A GameResponse enum value.
-
-    Raises:
-        ValueError: gyb_value is not one of "G", "Y", or "B".
-    """
-    if gyb_value == "G":
-        return GameResponse.CORRECT
-    if gyb_value == "Y":
-        return GameResponse.ELSEWHERE
-    if gyb_value == "B":
-        return GameResponse.INCORRECT
-
-    raise ValueError(f"{gyb_value} is not a supported GYB value.")
-
-
 def convert_to_guess(word: str, gyb: str) -> Guess:
     """Convert a user's command line input to a cromulence.wordle.Guess object.
 
@@ -77,13 +42,11 @@ def convert_to_guess(word: str, gyb: str) -> Guess:
 
     Returns:
         A Guess object.
-    """
-    if len(word) != len(gyb):
-        raise ValueError("Word and GYB values must be the same size")
 
-    return Guess(
-        [(word[i], gyb_to_game_response_enum(gyb[i])) for i in range(len(word))]
-    )
+    Raises:
+        ValueError: word and gyb are not the same size, or gyb is invalid.
+    """
+    return Guess.from_gyb(word, gyb)
 
 
 def filter_dict(word: str, d: Dictionary) -> Dictionary:
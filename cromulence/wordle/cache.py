@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2022 Karl Nicoll
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import json
+import logging
+import os
+import time
+from typing import Callable, List, Optional
+
+# Default time (in seconds) that a cached word list remains valid.
+DEFAULT_TTL = 24 * 60 * 60
+
+
+def default_cache_directory() -> str:
+    """Get the directory used to cache downloaded word lists.
+
+    This is ``$XDG_CACHE_HOME/cromulence``, or ``~/.cache/cromulence`` if
+    ``XDG_CACHE_HOME`` is not set.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "cromulence")
+
+
+def cached_word_list(
+    name: str,
+    download_fun: Callable[[], List[str]],
+    ttl: float = DEFAULT_TTL,
+    directory: Optional[str] = None,
+) -> List[str]:
+    """Get a word list from the on-disk cache, downloading it if necessary.
+
+    Word lists are stored as JSON files. A cached word list is used if it is
+    younger than ``ttl`` seconds, otherwise ``download_fun`` is called and the
+    result is written to the cache. Empty word lists (i.e. failed downloads)
+    are never cached.
+
+    Args:
+        name: The name of the word list, used as the cache file name.
+        download_fun: The function to execute to download the word list.
+        ttl: Maximum age, in seconds, of a usable cached word list.
+        directory: The cache directory. If None, the directory returned by
+            ``default_cache_directory()`` is used.
+
+    Returns:
+        A list of words.
+    """
+    directory = directory or default_cache_directory()
+    path = os.path.join(directory, f"{name}.json")
+
+    try:
+        if time.time() - os.path.getmtime(path) < ttl:
+            with open(path, encoding="utf-8") as f:
+                word_list = json.load(f)
+            logging.debug(f"Using cached word list '{path}'.")
+            return word_list
+    except (OSError, ValueError):
+        logging.debug(f"No usable cached word list at '{path}'.")
+
+    word_list = download_fun()
+    if not word_list:
+        return word_list
+
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(word_list, f)
+    except OSError as ex:
+        logging.warning(f"Failed to cache word list to '{path}': {ex}")
+
+    return word_list
@@ -21,15 +21,69 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-import html.parser
 import json
 import logging
+import numpy as np
 import re
 import requests
 from typing import Callable, Generator, List, Optional, Protocol
 
+from .cache import cached_word_list
+from .game_response import GameResponse
 from .guess import Guess
 
+# Scrabble-style letter scores, where lower scores are more common letters.
+_LETTER_SCORES = np.array(
+    [
+        1,
+        3,
+        3,
+        2,
+        1,
+        4,
+        2,
+        4,
+        1,
+        8,
+        5,
+        1,
+        3,  # A-M
+        1,
+        1,
+        3,
+        10,
+        1,
+        1,
+        1,
+        1,
+        4,
+        4,
+        8,
+        4,
+        10,  # N-Z
+    ],
+    dtype=np.int32,
+)
+
+
+# Matches the "src" attribute of the main Wordle game script tag.
+_MAIN_SCRIPT_REGEX = re.compile(
+    r"""<script\b[^>]*?\bsrc\s*=\s*["']?(main\.[0-9a-fA-F]+\.js)""",
+    re.IGNORECASE,
+)
+
+
+# Shared HTTP session, so that consecutive downloads from the same host reuse
+# the same (keep-alive) connection rather than each doing a new TCP and TLS
+# handshake.
+_SESSION = requests.Session()
+
+# The upper-case letters of the alphabet.
+_UPPER_CASE_LETTERS = bytes(range(ord("A"), ord("Z") + 1))
+
+# Matches the word list array in the main Wordle game script.
+_WORD_LIST_REGEX = re.compile(rb"(?<=ko=)\[[^]]*\]")
+
 
 class _DownloadOfficialDictionaryFunc(Protocol):
     def __call__(
@@ -39,7 +93,7 @@ class _DownloadOfficialDictionaryFunc(Protocol):
 
 
 def _download_official_dictionary(
-    download_fun: Callable[[str], requests.Response] = requests.get
+    download_fun: Callable[[str], requests.Response] = _SESSION.get,
 ) -> List[str]:
     """Download the default dictionary from the official Wordle game.
 
@@ -70,20 +124,34 @@ def _download_official_dictionary(
         return []
 
     script_uri = f"{uri_prefix}/{script_name}"
-    js = download_from_uri(script_uri, download_fun)
+    word_list_json = download_from_uri(script_uri, download_fun, _WORD_LIST_REGEX)
 
-    if not js:
+    if word_list_json is None:
         logging.error(f"Failed to get source for script '{script_uri}'")
         return []
 
-    logging.debug("Searching for word list...")
-    match_data = re.search(r"(?<=ko=)\[[^]]*\]", js)
-
-    if not match_data:
+    if not word_list_json:
         logging.error("Failed to find word list.")
         return []
 
-    return json.loads(match_data[0])
+    return json.loads(word_list_json)
+
+
+def _cached_official_dictionary(
+    download_fun: Callable[[str], requests.Response] = _SESSION.get,
+) -> List[str]:
+    """Get the official Wordle dictionary from the on-disk cache, downloading
+    it if the cached copy is missing or stale.
+
+    Args:
+        download_fun: The function to execute to download the web page.
+
+    Returns:
+        A list of words, or an empty list if the download failed.
+    """
+    return cached_word_list(
+        "official", lambda: _download_official_dictionary(download_fun)
+    )
 
 
 class Dictionary:
@@ -118,17 +186,75 @@ class Dictionary:
                 True when word list is already ranked, or False if the list
                 needs ranking in the constructor. If in doubt, use the default
                 value (False).
+
+        Raises:
+            ValueError: The words are not all the same length, or contain
+                line breaks or characters other than the letters A to Z.
         """
 
+        # Words are stored in the order given, alongside their scores. Sorting
+        # is deferred until the words are iterated, since most dictionaries
+        # only ever need their single best word. The whole word list is
+        # upper-cased in one call, rather than per word, which relies on no
+        # word containing a line break.
+        self._word_list = "\n".join(words).upper().split("\n") if words else []
+        if len(self._word_list) != len(words):
+            raise ValueError("Dictionary words must not contain line breaks")
+
+        self._columns = _encode_wordlist(self._word_list)
+
         if already_ranked:
-            self._word_list = [word.upper() for word in words]
+            self._scores = np.arange(len(self._word_list))
         else:
-            self._word_list = _rank_wordlist(words)
+            self._scores = _score_words(self._columns)
+
+        self._packed = _pack_columns(self._columns)
+        self._letter_masks = _letter_masks(self._columns)
+        self._letter_counts = None
+        self._ranked_order = None
+
+    @classmethod
+    def _from_arrays(
+        cls,
+        word_list: List[str],
+        columns: np.ndarray,
+        scores: np.ndarray,
+        packed: Optional[np.ndarray],
+        letter_masks: np.ndarray,
+    ) -> "Dictionary":
+        """Create a dictionary from already encoded and scored words, without
+        doing any further work.
+        """
+        d = cls.__new__(cls)
+        d._word_list = word_list
+        d._columns = columns
+        d._scores = scores
+        d._packed = packed
+        d._letter_masks = letter_masks
+        d._letter_counts = None
+        d._ranked_order = None
+        return d
+
+    def _get_ranked_order(self) -> np.ndarray:
+        """Get the indices of the words in rank order (best first)."""
+        if self._ranked_order is None:
+            self._ranked_order = np.argsort(self._scores, kind="stable")
+        return self._ranked_order
+
+    def _get_letter_counts(self) -> np.ndarray:
+        """Get the (26, N) letter count matrix created by ``_letter_counts()``.
+
+        The matrix is only built when a guess needs letters counted, as most
+        guesses (and most pruned dictionaries) never do.
+        """
+        if self._letter_counts is None:
+            self._letter_counts = _letter_counts(self._columns)
+        return self._letter_counts
 
     def __iter__(self) -> Generator[str, None, None]:
-        """Iterate the words in the dictionary."""
-        for word in self._word_list:
-            yield word
+        """Iterate the words in the dictionary, in rank order."""
+        for i in self._get_ranked_order():
+            yield self._word_list[i]
 
     def __len__(self) -> int:
         """Get the number of words in the dictionary"""
@@ -157,7 +283,9 @@ class Dictionary:
             dictionary is empty.
         """
         if self._word_list:
-            return self._word_list[0]
+            # argmin returns the first of any equally scored words, matching
+            # the (stable) rank order.
+            return self._word_list[int(np.argmin(self._scores))]
         else:
             return None
 
@@ -165,17 +293,64 @@ class Dictionary:
         """Create a copy of this dictionary containing only the words that
         could match the provided guess.
         """
-        return Dictionary(
-            words=[word for word in filter(guess.match, self._word_list)],
-            already_ranked=True,
+        if not self._word_list:
+            return Dictionary(words=[], already_ranked=True)
+
+        mask = _match_mask(
+            guess,
+            self._columns,
+            self._packed,
+            self._letter_masks,
+            self._get_letter_counts,
+        )
+        indices = np.flatnonzero(mask)
+        return Dictionary._from_arrays(
+            word_list=[self._word_list[i] for i in indices.tolist()],
+            columns=self._columns[:, indices],
+            scores=self._scores[indices],
+            packed=None if self._packed is None else self._packed[indices],
+            letter_masks=self._letter_masks[indices],
         )
 
+    def response_patterns(self, word: str) -> np.ndarray:
+        """Get the game's response to a guess word for every possible answer in
+        the dictionary.
+
+        Each response is encoded as a base-3 number, where digit ``i`` is the
+        ``GameResponse`` value of the response to character ``i`` of the
+        guess. Words that share a pattern cannot be told apart by guessing
+        ``word``, so the number of words per pattern (i.e.
+        ``numpy.bincount(patterns, minlength=3 ** word_size)``) measures how
+        much information the guess would reveal.
+
+        Args:
+            word: The guess word. Must be the same size as the words in the
+                dictionary.
+
+        Returns:
+            An array containing one pattern per dictionary word, in iteration
+            order.
+
+        Raises:
+            ValueError: word is not the same size as the dictionary's words.
+        """
+        if not self._word_list:
+            return np.empty(0, dtype=np.min_scalar_type(3 ** len(word) - 1))
+        if len(word) != self.word_size:
+            raise ValueError("Word must be the same size as the dictionary words")
+
+        patterns = _response_patterns(word.upper().encode("ascii"), self._columns)
+        return patterns[self._get_ranked_order()]
+
     @staticmethod
     def official(
-        download_fun: _DownloadOfficialDictionaryFunc = _download_official_dictionary,
+        download_fun: _DownloadOfficialDictionaryFunc = _cached_official_dictionary,
     ) -> "Dictionary":
         """Download the official Wordle dictionary from the New York Times.
 
+        By default, the downloaded word list is cached on disk, and re-used for
+        up to a day.
+
         Returns:
             A dictionary object.
 
@@ -189,34 +364,24 @@ class Dictionary:
         return Dictionary(word_list)
 
 
-class _JSFileExtractor(html.parser.HTMLParser):
-    def __init__(self):
-        super().__init__()
-        self.script_names = []
-
-    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
-        if tag != "script":
-            logging.debug(f"Ignoring HTML tag '{tag}'.")
-            return
-
-        for tpl in attrs:
-            if tpl[0] == "src":
-                logging.debug(f"Adding script source '{tpl[1]}'.")
-                self.script_names.append(str(tpl[1]))
-
-
 def download_from_uri(
     uri: str = "https://www.nytimes.com/games/wordle/index.html",
-    download_fun: Callable[[str], requests.Response] = requests.get,
+    download_fun: Callable[[str], requests.Response] = _SESSION.get,
+    pattern: Optional[re.Pattern[bytes]] = None,
 ) -> Optional[str]:
     """Download an object as a string from a given URI.
 
     Args:
         uri: The URI to find the content.
         download_fun: The function to execute to download the web page.
+        pattern: Optional regex to search the raw content for. When given,
+            only the matched text is decoded and returned, which avoids
+            decoding (and detecting the character set of) the whole response.
 
     Returns:
-        A string. None is returned if the request failed.
+        A string. None is returned if the request failed. If ``pattern`` is
+        given, the string is the text matched by the pattern, or empty if the
+        pattern was not found.
     """
     logging.debug(f"Downloading content from uri '{uri}'...")
 
@@ -224,7 +389,11 @@ def download_from_uri(
 
     if response.ok:
         logging.debug(f"Download of '{uri}' successful!")
-        return response.text
+        if pattern is None:
+            return response.text
+
+        match_data = pattern.search(response.content)
+        return match_data[0].decode("utf-8") if match_data else ""
     else:
         logging.error(
             f"Download of '{uri}' failed! Response code: {response.status_code}"
@@ -232,75 +401,193 @@ def download_from_uri(
         return None
 
 
-def _get_script_name_from_html(main_html: str):
-    html_parser = _JSFileExtractor()
-    html_parser.feed(main_html)
-    script_names = html_parser.script_names
+def _get_script_name_from_html(main_html: str) -> str:
+    """Find the name of the main Wordle game script in the game's HTML.
 
-    logging.debug(f"Found scripts: {script_names}")
+    Returns:
+        The script name, or an empty string if the script was not found.
+    """
+    match_data = _MAIN_SCRIPT_REGEX.search(main_html)
+    if not match_data:
+        return ""
 
-    for name in script_names:
-        if re.match(r"main.[0-9a-fA-F]+.js", name):
-            logging.debug(f"Found expected script: '{name}'.")
-            return name
-        logging.debug(f"Script not matching regex: '{name}'.")
+    logging.debug(f"Found expected script: '{match_data[1]}'.")
+    return match_data[1]
 
-    return ""
 
+def _encode_wordlist(words: List[str]) -> np.ndarray:
+    """Encode an upper-case word list as a (word_size, N) matrix of ASCII
+    character codes.
 
-def _rank_wordlist(words: List[str]) -> List[str]:
-    """Rank a given wordlist using scrabble-style scorings.
+    The matrix is stored column-major with respect to the words, so that row
+    ``i`` holds character ``i`` of every word in contiguous memory. Comparing
+    one character position across the whole dictionary is therefore a single
+    contiguous (and SIMD-friendly) scan, rather than a strided one.
 
-    Lower values are better.
+    Raises:
+        ValueError: The words are not all the same length, or contain
+            characters other than the letters A to Z.
     """
-    upper_words = [word.upper() for word in words]
-    sorted_order = sorted(
-        [(i, _score_word(word)) for i, word in enumerate(upper_words)],
-        key=lambda pair: pair[1],
-    )
+    if not words:
+        return np.empty((0, 0), dtype=np.uint8)
 
-    return [upper_words[i] for i, _ in sorted_order]
+    word_size = len(words[0])
+    if any(len(word) != word_size for word in words):
+        raise ValueError("All words in a dictionary must be the same length")
 
+    # Scoring and matching index per-letter tables, so anything other than A-Z
+    # (including non-ASCII characters, encoded as "?") is rejected up front.
+    buffer = "".join(words).encode("ascii", "replace")
+    if buffer.translate(None, _UPPER_CASE_LETTERS):
+        raise ValueError("Dictionary words must only contain the letters A to Z")
 
-def _score_word(word: str) -> int:
-    """Score a word based on the commonality of it's letters.
+    codes = np.frombuffer(buffer, dtype=np.uint8).reshape(len(words), word_size)
+    return np.ascontiguousarray(codes.T)
 
-    Repeated occurrences of letters are penalized."""
-    scores = [
-        1,
-        3,
-        3,
-        2,
-        1,
-        4,
-        2,
-        4,
-        1,
-        8,
-        5,
-        1,
-        3,  # A-M
-        1,
-        1,
-        3,
-        10,
-        1,
-        1,
-        1,
-        1,
-        4,
-        4,
-        8,
-        4,
-        10,  # N-Z
-    ]
 
-    final_score = 0
-    for ch in word:
-        array_index = ord(ch) - ord("A")
-        final_score += scores[array_index]
+def _pack_columns(columns: np.ndarray) -> Optional[np.ndarray]:
+    """Pack each word of an encoded word matrix into a single 64-bit integer.
+
+    Character ``i`` of each word occupies byte ``i`` of the integer (i.e. bits
+    ``8 * i`` to ``8 * i + 7``).
+
+    Returns:
+        An array of N uint64 values, or None if the words are too long to fit
+        in 64 bits.
+    """
+    word_size, word_count = columns.shape
+    if word_size > 8:
+        return None
+
+    padded = np.zeros((word_count, 8), dtype=np.uint8)
+    padded[:, :word_size] = columns.T
+    return padded.view("<u8").ravel()
+
+
+def _letter_masks(columns: np.ndarray) -> np.ndarray:
+    """Get a 26-bit mask per word of an encoded word matrix, where bit ``i`` is
+    set if the ``i``th letter of the alphabet appears in the word.
+    """
+    bits = np.left_shift(np.uint32(1), columns.astype(np.uint32) - ord("A"))
+    return np.bitwise_or.reduce(bits, axis=0, initial=np.uint32(0))
+
+
+def _match_mask(
+    guess: Guess,
+    columns: np.ndarray,
+    packed: Optional[np.ndarray],
+    letter_masks: np.ndarray,
+    get_letter_counts: Callable[[], np.ndarray],
+) -> np.ndarray:
+    """Vectorized equivalent of ``Guess.match`` over an encoded word matrix.
+
+    Args:
+        guess: The guess to match against.
+        columns: A (word_size, N) matrix, as created by ``_encode_wordlist()``.
+        packed: The packed form of ``columns``, as created by
+            ``_pack_columns()``.
+        letter_masks: Letter masks for ``columns``, as created by
+            ``_letter_masks()``.
+        get_letter_counts: Function returning the letter counts for
+            ``columns``, as created by ``_letter_counts()``. Only called if the
+            guess requires letters to be counted.
+
+    Returns:
+        A boolean array of length N, True for each word that could be a valid
+        answer given the game's response to the guess.
+    """
+    constraints = guess.constraints
+    mask = np.ones(columns.shape[1], dtype=bool)
+
+    if constraints.correct and packed is not None:
+        value = sum(code << (8 * i) for i, code in constraints.correct)
+        byte_mask = sum(0xFF << (8 * i) for i, _ in constraints.correct)
+        mask &= ((packed ^ np.uint64(value)) & np.uint64(byte_mask)) == 0
+    else:
+        for i, code in constraints.correct:
+            mask &= columns[i] == code
+
+    if constraints.required_bits:
+        required_bits = constraints.required_bits
+        mask &= (letter_masks & required_bits) == required_bits
+    if constraints.absent_bits:
+        mask &= (letter_masks & constraints.absent_bits) == 0
+
+    for i, code in constraints.misplaced:
+        mask &= columns[i] != code
+
+    for code, count, is_exact in constraints.counted:
+        counts = get_letter_counts()[code - ord("A")]
+        mask &= (counts == count) if is_exact else (counts >= count)
+
+    return mask
+
+
+def _response_patterns(guess_word: bytes, columns: np.ndarray) -> np.ndarray:
+    """Compute the game's response pattern to a guess word for every word in an
+    encoded word matrix, as described in ``Dictionary.response_patterns()``.
+    """
+    word_size, word_count = columns.shape
+    patterns = np.zeros(word_count, dtype=np.int64)
+    correct = [columns[i] == code for i, code in enumerate(guess_word)]
+
+    for code in set(guess_word):
+        # Occurrences of this letter in each answer that aren't matched by a
+        # CORRECT response. These are handed out as ELSEWHERE responses, in
+        # order, to the guess's remaining occurrences of the letter.
+        available = np.zeros(word_count, dtype=np.uint8)
+        for i, column in enumerate(columns):
+            available += (column == code) & ~correct[i]
+
+        for i, guess_code in enumerate(guess_word):
+            if guess_code != code:
+                continue
+
+            elsewhere = ~correct[i] & (available > 0)
+            available -= elsewhere
+            responses = np.where(correct[i], GameResponse.CORRECT, elsewhere)
+            patterns += responses * 3**i
+
+    return patterns.astype(np.min_scalar_type(3**word_size - 1))
+
+
+def _letter_counts(columns: np.ndarray) -> np.ndarray:
+    """Count the occurrences of each letter of the alphabet in every word of an
+    encoded word matrix.
+
+    Returns:
+        A (26, N) matrix, where element ``[i, j]`` is the number of times the
+        ``i``th letter of the alphabet appears in word ``j``.
+    """
+    word_count = columns.shape[1]
+    counts = np.zeros(26 * word_count, dtype=np.uint8)
+    word_indices = np.arange(word_count)
+
+    # Count into a flat array, where letter i of word j is at index
+    # i * N + j, since 1D fancy indexing is much cheaper than 2D. Each
+    # position contributes exactly one letter per word, so no element is
+    # incremented twice by the same fancy-indexed addition.
+    for column in columns:
+        letter_indices = column.astype(np.intp) - ord("A")
+        counts[letter_indices * word_count + word_indices] += 1
+
+    return counts.reshape(26, word_count)
+
+
+def _score_words(columns: np.ndarray) -> np.ndarray:
+    """Score each word in an encoded word matrix based on the commonality of
+    its letters.
+
+    Repeated occurrences of letters are penalized: each occurrence of a letter
+    scores one more than the previous occurrence.
+    """
+    letters = columns - ord("A")
+    scores = _LETTER_SCORES[letters].sum(axis=0)
 
-        # Increase the score of any future occurrences of the same character.
-        scores[array_index] += 1
+    # Penalize repeats by adding one per pair of matching letters; a letter
+    # that occurs k times is penalized 0 + 1 + ... + (k - 1).
+    for j in range(1, len(letters)):
+        for i in range(j):
+            scores += letters[i] == letters[j]
 
-    return final_score
+    return scores
@@ -21,14 +21,17 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from enum import auto, Enum, unique
+from enum import IntEnum, unique
 
 
 @unique
-class GameResponse(Enum):
+class GameResponse(IntEnum):
     """A response given by the game to the user to inform them how accurate
     their guess was.
 
+    Responses are integers, so that they can be compared cheaply and stored in
+    compact arrays.
+
     **Values:**
 
     INCORRECT
@@ -41,9 +44,9 @@ class GameResponse(Enum):
         response").
     """
 
-    INCORRECT = auto()
-    ELSEWHERE = auto()
-    CORRECT = auto()
+    INCORRECT = 0
+    ELSEWHERE = 1
+    CORRECT = 2
 
 
 def game_response_to_str(response: GameResponse):
@@ -53,12 +56,11 @@ def game_response_to_str(response: GameResponse):
         A single unicode character, one of "x", "⟷", or "✓". If an unsupported
         enum value is passed as an argument, "?" is returned.
     """
-
-    if response == GameResponse.INCORRECT:
-        return "x"
-    if response == GameResponse.ELSEWHERE:
-        return "⟷"
-    if response == GameResponse.CORRECT:
-        return "✓"
+    if isinstance(response, int) and 0 <= response < len(_RESPONSE_GLYPHS):
+        return _RESPONSE_GLYPHS[response]
 
     return "?"
+
+
+# Characters representing each response, indexed by GameResponse value.
+_RESPONSE_GLYPHS = ("x", "⟷", "✓")
@@ -21,10 +21,42 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from typing import List, Tuple
+import functools
+from typing import Callable, Dict, FrozenSet, List, NamedTuple, Tuple
 from .game_response import GameResponse, game_response_to_str
 
 
+class GuessConstraints(NamedTuple):
+    """The constraints that a guess places on the answer word.
+
+    Letters are represented by their ASCII character codes.
+
+    **Fields:**
+
+    correct
+        (position, letter) pairs: the answer has the letter at the position.
+    misplaced
+        (position, letter) pairs: the answer contains the letter, but not at
+        the position.
+    required_bits
+        26-bit mask of letters that the answer must contain, where bit ``i``
+        represents the ``i``th letter of the alphabet.
+    absent_bits
+        26-bit mask of letters that the answer must not contain.
+    counted
+        (letter, count, is_exact) tuples for letters where knowing whether the
+        answer contains the letter isn't enough: the answer must contain the
+        letter at least ``count`` times, or exactly ``count`` times if
+        ``is_exact`` is True.
+    """
+
+    correct: Tuple[Tuple[int, int], ...]
+    misplaced: Tuple[Tuple[int, int], ...]
+    required_bits: int
+    absent_bits: int
+    counted: Tuple[Tuple[int, int, bool], ...]
+
+
 class Guess:
     """A representation of a guess given back to the user by the game.
 
@@ -53,236 +85,300 @@ class Guess:
 
         Args:
             parts: Parts of the response.
-        """
-        self._parts = [(ch.upper(), game_response) for ch, game_response in parts]
 
-        for ch, _ in self._parts:
+        Raises:
+            ValueError: A part's character is not a single letter from A to Z
+                (in either case).
+        """
+        # Validate after upper-casing, since some characters (e.g. "ß") become
+        # several characters, which would misalign letters and responses.
+        letters = [ch.upper() for ch, _ in parts]
+        for ch in letters:
             if len(ch) != 1:
                 raise ValueError(
                     "Tuple first element must be a single unicode character"
                 )
 
-    def match(self, word: str) -> bool:
-        """Check to see if a given word could potentially be a valid answer,
-        given the game's response to this guess.
+        # Letters and responses are stored as parallel byte strings (ASCII
+        # character codes and GameResponse values respectively), so that
+        # matching compares small integers rather than unpacking tuples.
+        self._letters = _encode_letters("".join(letters))
+        self._responses = bytes([game_response for _, game_response in parts])
+
+    @classmethod
+    def from_gyb(cls, word: str, gyb: str) -> "Guess":
+        """Create a guess from a guess word and a string of "G"reen, "Y"ellow,
+        or "B"lack characters representing the game's response to each letter.
+
+        Example::
+
+            guess = Guess.from_gyb("CIGAR", "GYBYB")
+            print(repr(guess))
+            # [C(✓)][I(⟷)][G(x)][A(⟷)][R(x)]
 
         Args:
-            word: The word to check.
+            word: The guess word.
+            gyb: The game's response. Lower-case characters are allowed.
 
         Returns:
-            True if the word could be a valid answer, or False otherwise.
+            A Guess object.
+
+        Raises:
+            ValueError: word and gyb are not the same size, word contains
+                characters other than the letters A to Z, or gyb contains
+                characters other than "G", "Y", or "B".
         """
+        # Compare sizes after upper-casing, since some characters (e.g. "ß")
+        # become several characters.
         word = word.upper()
-        character_matched_list = [False] * len(word)
-
-        # Matching is done in three steps:
-        #
-        # 1. Scan the "CORRECT" matches, and make sure that the word has
-        #    the correct character at those locations.
-        # 2. Scan the "ELSEWHERE" matches, and make sure that these characters
-        #    are present in the word, but not at the specified index, and not
-        #    if already matched by rule #1.
-        # 3. Scan the INCORRECT matches, and make sure that the guess character
-        #    is not present anywhere in the string, unless already matched by
-        #    #1 amd #2.
-        match_functions = [
-            self._match_correct,
-            self._match_elsewhere,
-            self._match_incorrect,
+        if len(word) != len(gyb):
+            raise ValueError("Word and GYB values must be the same size")
+
+        responses = gyb.upper().encode("ascii", "replace").translate(_GYB_TABLE)
+        if _INVALID_RESPONSE in responses:
+            raise ValueError(f"{gyb} contains unsupported GYB values.")
+
+        guess = cls.__new__(cls)
+        guess._letters = _encode_letters(word)
+        guess._responses = responses
+        return guess
+
+    @property
+    def parts(self) -> List[Tuple[str, GameResponse]]:
+        """Get the characters in the guess, and the game's response to each."""
+        return [
+            (chr(ch), GameResponse(game_response))
+            for ch, game_response in zip(self._letters, self._responses)
         ]
-        for match_fun in match_functions:
-            match_result, character_matched_list = match_fun(
-                word, character_matched_list
-            )
-
-            if not match_result:
-                # Word did not meet the criteria for the match function, return
-                # early.
-                return False
-
-        return True
-
-    def __repr__(self) -> str:
-        return "".join(
-            [_character_to_str(ch, game_response) for ch, game_response in self._parts]
-        )
 
-    def __str__(self) -> str:
-        return "".join([ch for ch, _ in self._parts])
+    @property
+    def constraints(self) -> GuessConstraints:
+        """Get the constraints that this guess places on the answer word."""
+        return _compile_constraints(self._letters, self._responses)
 
-    def _match_correct(
-        self, word: str, character_matched_list: List[bool]
-    ) -> Tuple[bool, List[bool]]:
-        """Check a given word to see if any characters in this guess that were
-        marked by the game as "CORRECT" are in the correct place in the word.
+    def match(self, word: str) -> bool:
+        """Check to see if a given word could potentially be a valid answer,
+        given the game's response to this guess.
 
         Args:
-            word:
-                The word to match against the guess.
-            character_matched_list:
-                List of booleans. Each True indicates a letter already matched
-                by a previous rule, and should be excluded from matched by this
-                rule.
+            word: The word to check.
 
         Returns:
-            A tuple.
+            True if the word could be a valid answer, or False otherwise.
+        """
+        return self.match_upper(word.upper())
 
-            Element 1 is a single boolean, set to True if the word was a
-            successful match, or False if any character was out of place or
-            incorrect.
+    def match_upper(self, word: str) -> bool:
+        """Equivalent to ``match()``, for a word that is already upper-case.
 
-            Element 2 is a list of booleans, each True item in the list
-            indicates that the letter was matched in this function and should
-            not be used as a match candidate in other match functions (i.e.
-            ``self._match_elsewhere()`` and ``self._match_incorrect()``).
-        """
+        This avoids creating an upper-case copy of each word when matching many
+        words that are already normalized (e.g. the words in a ``Dictionary``).
 
-        character_matched_list = [False] * len(word)
-        for i, tpl in enumerate(self._parts):
-            guess_character, game_response = tpl
-            if game_response == GameResponse.CORRECT:
-                if word[i] != guess_character:
-                    # Character doesn't match. Instant fail.
-                    return (False, character_matched_list)
+        Args:
+            word: The upper-case word to check.
 
-                # Mark this character as matched, so that the fuzzy matches
-                # (ELSEWHERE) don't try to reuse these values.
-                character_matched_list[i] = True
+        Returns:
+            True if the word could be a valid answer, or False otherwise.
+        """
+        match = _compile_matcher(self._letters, self._responses)
+        return match(word.encode("ascii", "replace"))
 
-        return (True, character_matched_list)
+    def __repr__(self) -> str:
+        return "".join(
+            [
+                _character_to_str(chr(ch), game_response)
+                for ch, game_response in zip(self._letters, self._responses)
+            ]
+        )
 
-    def _match_elsewhere(
-        self, word: str, character_matched_list: List[bool]
-    ) -> Tuple[bool, List[bool]]:
-        """Check a given word to see if any characters in this guess that were
-        marked by the game as "ELSEWHERE" are at any allowed location in the
-        word.
+    def __str__(self) -> str:
+        return self._letters.decode("ascii")
 
-        Args:
-            word:
-                The word to match against the guess.
-            character_matched_list:
-                List of booleans. Each True indicates a letter already matched
-                by a previous rule, and should be excluded from matched by this
-                rule.
 
-        Returns:
-            A tuple.
+@functools.lru_cache(maxsize=1024)
+def _compile_constraints(letters: bytes, responses: bytes) -> GuessConstraints:
+    """Compile a guess's letters and responses to a GuessConstraints object.
 
-            Element 1 is a single boolean, set to True if the word was a
-            successful match, or False if any character was out of place or
-            incorrect.
+    Results are cached, since the same guess is often matched against several
+    dictionaries (e.g. Quordle), or re-created from the same user input.
+    """
+    correct = []
+    misplaced = []
+
+    # Minimum number of times each letter must appear in the word (one per
+    # CORRECT or ELSEWHERE response), and the letters that also received an
+    # INCORRECT response, meaning that the minimum is also the exact count.
+    min_counts: Dict[int, int] = {}
+    correct_counts: Dict[int, int] = {}
+    capped_letters = set()
+    for i, (code, game_response) in enumerate(zip(letters, responses)):
+        if game_response == GameResponse.CORRECT:
+            correct.append((i, code))
+            correct_counts[code] = correct_counts.get(code, 0) + 1
+            min_counts[code] = min_counts.get(code, 0) + 1
+        elif game_response == GameResponse.ELSEWHERE:
+            misplaced.append((i, code))
+            min_counts[code] = min_counts.get(code, 0) + 1
+        elif game_response == GameResponse.INCORRECT:
+            misplaced.append((i, code))
+            capped_letters.add(code)
+
+    # Letters that must not appear at all are covered by absent_bits, so don't
+    # need to be checked position by position. Letters that must appear once
+    # are covered by required_bits, and letters that only appear as CORRECT
+    # responses are covered by the positional check.
+    return GuessConstraints(
+        correct=tuple(correct),
+        misplaced=tuple((i, code) for i, code in misplaced if code in min_counts),
+        required_bits=_letter_bits(min_counts),
+        absent_bits=_letter_bits(capped_letters.difference(min_counts)),
+        counted=tuple(
+            (code, min_count, code in capped_letters)
+            for code, min_count in min_counts.items()
+            if code in capped_letters or min_count > max(correct_counts.get(code, 0), 1)
+        ),
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_matcher(letters: bytes, responses: bytes) -> Callable[[bytes], bool]:
+    """Generate a specialized match function for a guess.
+
+    The function is straight-line code with the guess's rules (see
+    ``_compile_match_rules()``) baked in as constants, which avoids looping
+    over positions and unpacking rule tuples on every call.
+
+    Returns:
+        A function that accepts an upper-case, ASCII-encoded word, and returns
+        True if the word could be a valid answer, or False otherwise.
+    """
+    position_rules, letter_bounds = _compile_match_rules(letters, responses)
+
+    # Matching is done in two steps:
+    #
+    # 1. Make sure that each "CORRECT" location has the correct character,
+    #    and that no other location has a character that is forbidden there
+    #    (either because the game said it belongs elsewhere, or because it
+    #    isn't in the answer).
+    # 2. Make sure that each letter in the guess appears in the word between
+    #    its minimum and maximum number of times.
+    #
+    # Only integers are interpolated into the source, so text from the guess
+    # can never end up in the generated code.
+    lines = ["def match(word):"]
+    for i, correct_code, forbidden_codes in position_rules:
+        if correct_code:
+            lines.append(f"    if word[{i}] != {correct_code}: return False")
+        elif forbidden_codes:
+            codes = ", ".join(str(code) for code in sorted(forbidden_codes))
+            lines.append(f"    if word[{i}] in {{{codes}}}: return False")
+
+    for code, min_count, max_count in letter_bounds:
+        lines.append(f"    count = word.count({code})")
+        lines.append(f"    if count < {min_count} or count > {max_count}: return False")
+
+    lines.append("    return True")
+
+    namespace: Dict[str, Callable[[bytes], bool]] = {}
+    exec("\n".join(lines), namespace)
+    return namespace["match"]
+
+
+def _compile_match_rules(
+    letters: bytes, responses: bytes
+) -> Tuple[
+    Tuple[Tuple[int, int, FrozenSet[int]], ...], Tuple[Tuple[int, int, int], ...]
+]:
+    """Compile a guess's letters and responses to the rules used by
+    ``Guess.match()``.
+
+    Returns:
+        A tuple of two elements.
+
+        Element 1 has a (position, correct, forbidden) tuple for each position
+        in the guess. ``correct`` is the character code required at the
+        position (or 0 if any character is allowed), and ``forbidden`` is the
+        set of character codes not allowed at the position.
+
+        Element 2 has a (letter, min_count, max_count) tuple for each letter in
+        the guess, giving the allowed number of occurrences of that letter.
+    """
+    constraints = _compile_constraints(letters, responses)
+    absent_codes = {c for c in _LETTER_CODES if constraints.absent_bits & _bit(c)}
+
+    correct_codes = [0] * len(letters)
+    for i, code in constraints.correct:
+        correct_codes[i] = code
+
+    forbidden_codes = [set(absent_codes) for _ in letters]
+    for i, code in constraints.misplaced:
+        forbidden_codes[i].add(code)
+
+    # Absent letters are already forbidden at every position. Present letters
+    # default to appearing at least once.
+    bounds = {
+        code: (1, len(letters))
+        for code in _LETTER_CODES
+        if constraints.required_bits & _bit(code)
+    }
+    for code, count, is_exact in constraints.counted:
+        bounds[code] = (count, count if is_exact else len(letters))
+
+    return (
+        tuple(
+            (i, correct_codes[i], frozenset(forbidden_codes[i]))
+            for i in range(len(letters))
+        ),
+        tuple(
+            (code, min_count, max_count)
+            for code, (min_count, max_count) in bounds.items()
+        ),
+    )
+
+
+def _encode_letters(text: str) -> bytes:
+    """Encode upper-case text as ASCII character codes.
+
+    Raises:
+        ValueError: text contains characters other than the letters A to Z.
+    """
+    letters = text.encode("ascii", "replace")
+    if letters.translate(None, _UPPER_CASE_LETTERS):
+        raise ValueError(f"'{text}' must only contain the letters A to Z")
+    return letters
 
-            Element 2 is a list of booleans, each True item in the list
-            indicates that the letter was matched in this function and should
-            not be used as a match candidate in other match functions (i.e.
-            ``self._match_incorrect()``).
-        """
 
-        # This array contains all the characters we already marked as "found" in
-        # the guess. If the guess has double of the same character, the first
-        # occurrence of that character will match all occurrences in the word,
-        # and any subsequent occurrences will fail to find a letter in the word
-        # that wasn't already martched.
-        #
-        # Therefore, check this array, if the guess already scanned the word for
-        # a character, subsequent attempts should just attempt to ensure that
-        # the character appears multiple times.
-        character_count_mismatches = {}
-
-        for i, tpl in enumerate(self._parts):
-            guess_character, game_response = tpl
-
-            if game_response == GameResponse.ELSEWHERE:
-                if word[i] == guess_character:
-                    # Character is at this location, instant fail (ELSEWHERE
-                    # means that the character must appear in this string, but
-                    # not at index i).
-                    return (False, character_matched_list)
-
-                if guess_character in character_count_mismatches:
-                    unmatched_count = character_count_mismatches[guess_character]
-                    if unmatched_count > 0:
-                        character_count_mismatches[guess_character] -= 1
-                    else:
-                        # Character already exists in string, but not enough
-                        # times.
-                        return (False, character_matched_list)
-                    continue
-
-
-                match_found = False
-                for j, ch in enumerate(word):
-                    # Note that the full word is scanned, even if we find a
-                    # match. If the word contains multiple of the same letter,
-                    # there may be multiple valid locations for this character.
-                    if (character_matched_list[j]) or (ch != guess_character):
-                        continue
-
-                    guess_character_at_j, game_response_at_j = self._parts[j]
-                    guess_character_at_j_matches = (
-                        guess_character_at_j == guess_character
-                    )
-                    character_allowed_at_j = game_response_at_j == GameResponse.CORRECT
-                    if guess_character_at_j_matches and not character_allowed_at_j:
-                        # If the character matches, but the game disallows
-                        # this character at this location, continue looking...
-                        continue
-
-                    # Guess doesn't care that ch is at this location, so
-                    # consider it a match.
-                    character_matched_list[j] = True
-                    match_found = True
-                    if guess_character in character_count_mismatches:
-                        character_count_mismatches[guess_character] += 1
-                    else:
-                        character_count_mismatches[guess_character] = 0
-
-                if not match_found:
-                    # Elsewhere means that the character must appear somewhere.
-                    # If no match found in the word, word is not a potential
-                    # correct answer based on this guess.
-                    return (False, character_matched_list)
-
-        return (True, character_matched_list)
-
-    def _match_incorrect(
-        self, word: str, character_matched_list: List[bool]
-    ) -> Tuple[bool, List[bool]]:
-        """Check a given word to see if any characters in this guess that were
-        marked by the game as "ELSEWHERE" are at any allowed location in the
-        word.
+def _bit(code: int) -> int:
+    """Get the 26-bit letter mask bit for a character code."""
+    return 1 << (code - ord("A"))
 
-        Args:
-            word:
-                The word to match against the guess.
-            character_matched_list:
-                List of booleans. Each True indicates a letter already matched
-                by a previous rule, and should be excluded from matched by this
-                rule.
 
-        Returns:
-            A tuple.
+def _letter_bits(letter_codes) -> int:
+    """Convert a collection of character codes to a 26-bit letter mask."""
+    bits = 0
+    for code in letter_codes:
+        bits |= 1 << (code - ord("A"))
+    return bits
 
-            Element 1 is a single boolean, set to True if the word was a
-            successful match, or False if any character was out of place or
-            incorrect.
 
-            Element 2 is a list of booleans, each True item in the list
-            indicates that the letter was matched in this function and should
-            not be used as a match candidate in other match functions (i.e.
-            ``self._match_incorrect()``).
-        """
+# Character codes of the (upper-case) letters of the alphabet.
+_LETTER_CODES = range(ord("A"), ord("Z") + 1)
 
-        for tpl in self._parts:
-            guess_character, game_response = tpl
+# The upper-case letters of the alphabet.
+_UPPER_CASE_LETTERS = bytes(_LETTER_CODES)
 
-            if game_response == GameResponse.INCORRECT:
-                for j, ch in enumerate(word):
-                    if (ch == guess_character) and (not character_matched_list[j]):
-                        return (False, character_matched_list)
+# Sentinel for characters in a GYB string that are not a valid response.
+_INVALID_RESPONSE = 0xFF
 
-        return (True, character_matched_list)
+# Translation table from GYB characters to GameResponse values.
+_GYB_TABLE = bytes(
+    {
+        ord("G"): GameResponse.CORRECT,
+        ord("Y"): GameResponse.ELSEWHERE,
+        ord("B"): GameResponse.INCORRECT,
+    }.get(i, _INVALID_RESPONSE)
+    for i in range(256)
+)
 
 
 def _character_to_str(character, game_response):
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2022 Karl Nicoll
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from cromulence.wordle.cache import cached_word_list
+from unittest.mock import MagicMock
+import os
+import tempfile
+import time
+import unittest
+
+
+class TestCachedWordList(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.directory = self._temp_dir.name
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def test_cache_miss_downloads_word_list(self):
+        download_fun = MagicMock(return_value=["ABC", "DEF"])
+
+        actual = cached_word_list("test", download_fun, directory=self.directory)
+
+        self.assertEqual(["ABC", "DEF"], actual)
+        download_fun.assert_called_once()
+
+    def test_cache_hit_skips_download(self):
+        cached_word_list("test", lambda: ["ABC", "DEF"], directory=self.directory)
+        download_fun = MagicMock(return_value=["XYZ"])
+
+        actual = cached_word_list("test", download_fun, directory=self.directory)
+
+        self.assertEqual(["ABC", "DEF"], actual)
+        download_fun.assert_not_called()
+
+    def test_stale_cache_downloads_word_list(self):
+        cached_word_list("test", lambda: ["ABC", "DEF"], directory=self.directory)
+        stale_time = time.time() - 3600
+        os.utime(os.path.join(self.directory, "test.json"), (stale_time, stale_time))
+
+        actual = cached_word_list(
+            "test", lambda: ["XYZ"], ttl=60, directory=self.directory
+        )
+
+        self.assertEqual(["XYZ"], actual)
+
+    def test_empty_word_list_is_not_cached(self):
+        cached_word_list("test", lambda: [], directory=self.directory)
+        download_fun = MagicMock(return_value=["XYZ"])
+
+        actual = cached_word_list("test", download_fun, directory=self.directory)
+
+        self.assertEqual(["XYZ"], actual)
+        download_fun.assert_called_once()
+
+    def test_corrupt_cache_downloads_word_list(self):
+        with open(os.path.join(self.directory, "test.json"), "w") as f:
+            f.write("not json")
+
+        actual = cached_word_list("test", lambda: ["XYZ"], directory=self.directory)
+
+        self.assertEqual(["XYZ"], actual)
@@ -25,10 +25,13 @@ from cromulence.wordle.dictionary import (
     Dictionary,
     download_from_uri,
     _download_official_dictionary,
+    _get_script_name_from_html,
 )
 from cromulence.wordle.guess import Guess
 from cromulence.wordle.game_response import GameResponse
 from unittest.mock import MagicMock
+import itertools
+import re
 import requests
 import unittest
 
@@ -49,6 +52,29 @@ class TestDictionary(unittest.TestCase):
 
         self.assertEqual(output_wordlist, expected_wordlist)
 
+    def test_initialize_with_different_word_sizes_raises(self):
+        with self.assertRaises(ValueError):
+            Dictionary(["ABCDE", "ABC", "ABCDEFG"])
+
+    def test_initialize_with_non_ascii_word_raises(self):
+        with self.assertRaises(ValueError):
+            Dictionary(["ABC", "ÅBC"])
+
+    def test_initialize_with_non_letter_raises(self):
+        with self.assertRaises(ValueError):
+            Dictionary(["A1C", "ABC"])
+
+    def test_initialize_with_line_break_in_word_raises(self):
+        with self.assertRaises(ValueError):
+            Dictionary(["ABC", "A\nC"])
+
+    def test_initialize_upper_cases_words(self):
+        d = Dictionary(["abc", "Aba", "xyZ"])
+        output_wordlist = [word for word in d]
+        expected_wordlist = ["ABA", "ABC", "XYZ"]
+
+        self.assertEqual(output_wordlist, expected_wordlist)
+
     def test_dictionary_provides_length(self):
         d = Dictionary(["ABC", "ABA", "XYZ"])
         expected_length = 3
@@ -91,6 +117,14 @@ class TestDictionary(unittest.TestCase):
 
         self.assertEqual(expected_word, actual_word)
 
+    def test_most_likely_word_is_first_of_equally_ranked_words(self):
+        d = Dictionary(["XYZ", "BAC", "ABC", "CAB"])
+        expected_word = "BAC"
+        actual_word = d.get_most_likely_word()
+
+        self.assertEqual(expected_word, actual_word)
+        self.assertEqual(["BAC", "ABC", "CAB", "XYZ"], [word for word in d])
+
     def test_most_likely_word_is_none_when_dictionary_is_empty(self):
         d = Dictionary([])
         actual_word = d.get_most_likely_word()
@@ -140,6 +174,100 @@ class TestDictionary(unittest.TestCase):
 
         self.assertEqual(expected_wordlist, output_wordlist)
 
+    def test_prune_limits_repeated_characters_marked_incorrect(self):
+        d = Dictionary(["DACB", "ADCC", "CADB"])
+
+        guess = Guess(
+            [
+                ("C", GameResponse.ELSEWHERE),
+                ("C", GameResponse.INCORRECT),
+                ("E", GameResponse.INCORRECT),
+                ("D", GameResponse.ELSEWHERE),
+            ]
+        )
+
+        # The second "C" is marked INCORRECT, so the answer contains exactly one
+        # "C", eliminating "ADCC". "CADB" has the "C" in a disallowed location.
+        d2 = d.prune(guess)
+        output_wordlist = [word for word in d2]
+        expected_wordlist = ["DACB"]
+
+        self.assertEqual(expected_wordlist, output_wordlist)
+
+    def test_prune_words_longer_than_eight_characters(self):
+        d = Dictionary(["ABCDEFGHI", "ABCDEFGHJ", "BBCDEFGHI"])
+
+        guess = Guess(
+            [
+                ("A", GameResponse.CORRECT),
+                ("B", GameResponse.CORRECT),
+                ("C", GameResponse.CORRECT),
+                ("D", GameResponse.CORRECT),
+                ("E", GameResponse.CORRECT),
+                ("F", GameResponse.CORRECT),
+                ("G", GameResponse.CORRECT),
+                ("H", GameResponse.CORRECT),
+                ("Z", GameResponse.INCORRECT),
+            ]
+        )
+
+        d2 = d.prune(guess)
+        output_wordlist = sorted(word for word in d2)
+        expected_wordlist = ["ABCDEFGHI", "ABCDEFGHJ"]
+
+        self.assertEqual(expected_wordlist, output_wordlist)
+
+    def test_prune_agrees_with_guess_match(self):
+        d = Dictionary(["".join(w) for w in itertools.product("ABCD", repeat=4)])
+
+        for word, gyb in [
+            ("AABB", "YBGB"),
+            ("ABCA", "YYBB"),
+            ("CCCA", "GYBB"),
+            ("DADA", "BYGY"),
+        ]:
+            guess = Guess.from_gyb(word, gyb)
+
+            self.assertEqual(
+                sorted(w for w in d if guess.match(w)), sorted(d.prune(guess))
+            )
+
+    def test_prune_empty_dictionary(self):
+        d = Dictionary([])
+
+        guess = Guess([("A", GameResponse.CORRECT)])
+        d2 = d.prune(guess)
+
+        self.assertEqual(0, len(d2))
+
+    def test_response_patterns(self):
+        d = Dictionary(["ABC", "CAB", "XYZ", "AAB"], already_ranked=True)
+
+        # Digit i of each (base-3) pattern is the response to the guess's
+        # character i: INCORRECT = 0, ELSEWHERE = 1, CORRECT = 2.
+        actual = list(d.response_patterns("aba"))
+        expected = [
+            2 + 2 * 3 + 0 * 9,  # "ABC": [A(✓)][B(✓)][A(x)]
+            1 + 1 * 3 + 0 * 9,  # "CAB": [A(⟷)][B(⟷)][A(x)]
+            0 + 0 * 3 + 0 * 9,  # "XYZ": [A(x)][B(x)][A(x)]
+            2 + 1 * 3 + 1 * 9,  # "AAB": [A(✓)][B(⟷)][A(⟷)]
+        ]
+
+        self.assertEqual(expected, actual)
+
+    def test_response_patterns_rejects_wrong_size_word(self):
+        d = Dictionary(["ABC", "CAB", "XYZ"])
+
+        with self.assertRaises(ValueError):
+            d.response_patterns("ABCD")
+
+    def test_response_patterns_empty_dictionary(self):
+        d = Dictionary([])
+
+        patterns = d.response_patterns("ABC")
+
+        self.assertEqual([], patterns.tolist())
+
     def test_official_word_list_returns_dictionary(self):
         def fake_download_function():
             return ["ABC", "DEF", "GHI"]
@@ -167,6 +295,28 @@ class TestDownloadFromUriHelper(unittest.TestCase):
 
         self.assertEqual("FOO", download_from_uri("http://test", mock_download_fun))
 
+    def test_successful_download_with_pattern(self):
+        mock_download_fun = MagicMock()
+        mock_download_fun.return_value = requests.Response()
+        mock_download_fun.return_value.status_code = 200
+        mock_download_fun.return_value._content = b"FOO BAR BAZ"
+
+        self.assertEqual(
+            "BAR",
+            download_from_uri("http://test", mock_download_fun, re.compile(rb"B.R")),
+        )
+
+    def test_successful_download_with_missing_pattern(self):
+        mock_download_fun = MagicMock()
+        mock_download_fun.return_value = requests.Response()
+        mock_download_fun.return_value.status_code = 200
+        mock_download_fun.return_value._content = b"FOO"
+
+        self.assertEqual(
+            "",
+            download_from_uri("http://test", mock_download_fun, re.compile(rb"BAR")),
+        )
+
     def test_failed_download(self):
         mock_download_fun = MagicMock()
         mock_download_fun.return_value = requests.Response()
@@ -176,6 +326,21 @@ class TestDownloadFromUriHelper(unittest.TestCase):
         self.assertIsNone(download_from_uri("http://test", mock_download_fun))
 
 
+class TestGetScriptNameFromHtml(unittest.TestCase):
+    def test_script_with_other_attributes(self):
+        main_html = (
+            '<html><script src="foo.js"></script>'
+            "<script type='module' src='main.0a1b2c.js' defer></script></html>"
+        )
+
+        self.assertEqual("main.0a1b2c.js", _get_script_name_from_html(main_html))
+
+    def test_missing_script_returns_empty_string(self):
+        main_html = '<html><link href="main.0a1b2c.js"></html>'
+
+        self.assertEqual("", _get_script_name_from_html(main_html))
+
+
 class TestDownloadOfficialWordleDictionary(unittest.TestCase):
     def test_successful_download(self):
         def fake_download_fun(uri):
@@ -49,3 +49,10 @@ class TestGameResponseToStr(unittest.TestCase):
         actual = game_response_to_str(999)
 
         self.assertEqual(expected, actual)
+
+
+class TestGameResponse(unittest.TestCase):
+    def test_values_are_integers(self):
+        self.assertEqual(0, GameResponse.INCORRECT)
+        self.assertEqual(1, GameResponse.ELSEWHERE)
+        self.assertEqual(2, GameResponse.CORRECT)
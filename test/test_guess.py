@@ -22,7 +22,7 @@
 # SOFTWARE.
 
 from cromulence.wordle.game_response import GameResponse
-from cromulence.wordle.guess import Guess
+from cromulence.wordle.guess import Guess, GuessConstraints
 import unittest
 
 
@@ -51,6 +51,16 @@ class TestGuess(unittest.TestCase):
                 ]
             )
 
+    def test_char_that_upper_cases_to_several_chars_raises(self):
+        with self.assertRaises(ValueError):
+            Guess([("ß", GameResponse.CORRECT), ("a", GameResponse.INCORRECT)])
+
+    def test_non_letter_raises(self):
+        with self.assertRaises(ValueError):
+            Guess([("1", GameResponse.INCORRECT)])
+        with self.assertRaises(ValueError):
+            Guess([("[", GameResponse.INCORRECT)])
+
     def test_match_correct_word(self):
         g = Guess(
             [
@@ -161,6 +171,12 @@ class TestGuess(unittest.TestCase):
 
         self.assertTrue(actual)
 
+    def test_match_upper(self):
+        g = Guess.from_gyb("cigar", "gybyb")
+
+        self.assertTrue(g.match_upper("CHAIN"))
+        self.assertFalse(g.match_upper("CHARM"))
+
     def test_all_repeated_characters_in_word_with_all_elsewhere_responses_in_guess(
         self,
     ):
@@ -236,6 +252,77 @@ class TestGuess(unittest.TestCase):
         # Should match
         self.assertFalse(actual)
 
+    def test_parts(self):
+        g = Guess(
+            [
+                ("f", GameResponse.CORRECT),
+                ("o", GameResponse.ELSEWHERE),
+            ]
+        )
+
+        expected = [("F", GameResponse.CORRECT), ("O", GameResponse.ELSEWHERE)]
+        actual = g.parts
+
+        self.assertEqual(expected, actual)
+
+    def test_from_gyb(self):
+        g = Guess.from_gyb("foo", "gyB")
+
+        expected = "[F(✓)][O(⟷)][O(x)]"
+        actual = repr(g)
+
+        self.assertEqual(expected, actual)
+
+    def test_from_gyb_invalid_response_raises(self):
+        with self.assertRaises(ValueError):
+            Guess.from_gyb("foo", "GYX")
+
+    def test_from_gyb_size_mismatch_raises(self):
+        with self.assertRaises(ValueError):
+            Guess.from_gyb("foo", "GY")
+
+    def test_from_gyb_char_that_upper_cases_to_several_chars_raises(self):
+        with self.assertRaises(ValueError):
+            Guess.from_gyb("ßa", "GB")
+
+    def test_from_gyb_non_letter_raises(self):
+        with self.assertRaises(ValueError):
+            Guess.from_gyb("a1c", "GBB")
+
+    def test_incorrect_repeated_character_limits_character_count(self):
+        g = Guess(
+            [
+                ("c", GameResponse.ELSEWHERE),
+                ("c", GameResponse.INCORRECT),
+                ("e", GameResponse.INCORRECT),
+                ("d", GameResponse.ELSEWHERE),
+            ]
+        )
+
+        actual = g.match("adcc")
+
+        # The second "c" is marked INCORRECT, so the answer contains exactly
+        # one "c".
+        self.assertFalse(actual)
+
+    def test_constraints(self):
+        g = Guess.from_gyb("rarer", "GYBBY")
+
+        # "R" appears in the answer at index 0, and somewhere other than index
+        # 4 (but not at index 2, where it was marked as INCORRECT), so it
+        # appears exactly twice. "A" must appear, but not at index 1. "E" must
+        # not appear.
+        expected = GuessConstraints(
+            correct=((0, ord("R")),),
+            misplaced=((1, ord("A")), (2, ord("R")), (4, ord("R"))),
+            required_bits=(1 << 0) | (1 << 17),
+            absent_bits=1 << 4,
+            counted=((ord("R"), 2, True),),
+        )
+        actual = g.constraints
+
+        self.assertEqual(expected, actual)
+
     def test_str(self):
         g = Guess(
             [